@@ -1,18 +1,50 @@
 from __future__ import annotations
 
-import base64
+import binascii
 import hashlib
+import heapq
 import hmac
+import itertools
 import os
-import secrets
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 
 from .db import Database
 
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # argon2-cffi is optional; fall back to scrypt-only hashing
+    PasswordHasher = None
+
+    # never raised; keeps verify_password_argon2's except clause valid so AuthError surfaces
+    class VerificationError(Exception):
+        pass
+
+    class InvalidHashError(Exception):
+        pass
+
 ROLE_READONLY = "readonly"
 
+ARGON2_PREFIX = "$argon2id$"
+
+KDF_ARGON2ID = "argon2id"
+KDF_SCRYPT = "scrypt"
+
+# Successful password checks are remembered briefly so repeated logins skip scrypt.
+VERIFY_CACHE_MAXSIZE = 1024
+VERIFY_CACHE_TTL_SECONDS = 30.0
+
+LOGIN_RATE_WINDOW_SECONDS = 60.0
+LOGIN_RATE_MAX_ATTEMPTS = 10
+# idle per-client buckets are swept this often rather than on every login
+LOGIN_RATE_GC_INTERVAL_SECONDS = LOGIN_RATE_WINDOW_SECONDS
+
+# verify_token only sweeps expired sessions this often; the requested token is always checked inline.
+SESSION_GC_INTERVAL_SECONDS = 30
+
 
 class AuthError(Exception):
     pass
@@ -30,13 +62,23 @@ class InvalidToken(AuthError):
     pass
 
 
+class LoginRateLimited(AuthError):
+    pass
+
+
+_B64_ENCODE_TRANS = bytes.maketrans(b"+/", b"-_")
+_B64_DECODE_TRANS = bytes.maketrans(b"-_", b"+/")
+
+
 def _b64(data: bytes) -> str:
-    return base64.urlsafe_b64encode(data).decode("ascii")
+    # urlsafe alphabet with padding, same output as base64.urlsafe_b64encode
+    return binascii.b2a_base64(data, newline=False).translate(_B64_ENCODE_TRANS).decode("ascii")
 
 
 
 def _b64decode(data: str) -> bytes:
-    return base64.urlsafe_b64decode(data.encode("ascii"))
+    raw = data.encode("ascii").translate(_B64_DECODE_TRANS)
+    return binascii.a2b_base64(raw + b"=" * (-len(raw) % 4))
 
 
 # Format: scrypt$N$r$p$salt_b64$hash_b64
@@ -51,24 +93,24 @@ def hash_password(password: str, *, n: int = 2**14, r: int = 8, p: int = 1) -> s
 
 
 
-def verify_password(password: str, encoded: str) -> bool:
+def _parse_encoded(encoded: str) -> tuple[int, int, int, bytes, bytes] | None:
     try:
         algo, n, r, p, salt_b64, hash_b64 = encoded.split("$", maxsplit=5)
     except ValueError:
-        return False
+        return None
 
     if algo != "scrypt":
-        return False
+        return None
 
     try:
-        n_int = int(n)
-        r_int = int(r)
-        p_int = int(p)
-        salt = _b64decode(salt_b64)
-        expected = _b64decode(hash_b64)
+        return int(n), int(r), int(p), _b64decode(salt_b64), _b64decode(hash_b64)
     except Exception:
-        return False
+        return None
+
+
 
+def _verify_parsed(password: str, parsed: tuple[int, int, int, bytes, bytes]) -> bool:
+    n_int, r_int, p_int, salt, expected = parsed
     actual = hashlib.scrypt(
         password.encode("utf-8"),
         salt=salt,
@@ -80,7 +122,61 @@ def verify_password(password: str, encoded: str) -> bool:
     return hmac.compare_digest(actual, expected)
 
 
-@dataclass
+
+def verify_password(password: str, encoded: str) -> bool:
+    if encoded.startswith(ARGON2_PREFIX):
+        return verify_password_argon2(password, encoded)
+
+    parsed = _parse_encoded(encoded)
+    if parsed is None:
+        return False
+    return _verify_parsed(password, parsed)
+
+
+
+def argon2_available() -> bool:
+    return PasswordHasher is not None
+
+
+
+def _argon2_hasher() -> "PasswordHasher":
+    if PasswordHasher is None:
+        raise AuthError("argon2-cffi is not installed")
+    return PasswordHasher(time_cost=3, memory_cost=65536, parallelism=4)
+
+
+
+# Format: $argon2id$v=19$m=65536,t=3,p=4$salt_b64$hash_b64 (argon2 PHC string)
+
+def hash_password_argon2(password: str) -> str:
+    if not password:
+        raise ValueError("password must not be empty")
+    return _argon2_hasher().hash(password)
+
+
+
+def verify_password_argon2(password: str, encoded: str) -> bool:
+    try:
+        return _argon2_hasher().verify(encoded, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+
+def hash_new_password(
+    password: str,
+    *,
+    kdf: str = KDF_ARGON2ID,
+    n: int = 2**14,
+    r: int = 8,
+    p: int = 1,
+) -> str:
+    if kdf == KDF_ARGON2ID and argon2_available():
+        return hash_password_argon2(password)
+    return hash_password(password, n=n, r=r, p=p)
+
+
+@dataclass(frozen=True)
 class SessionInfo:
     token: str
     expires_at: int
@@ -88,59 +184,187 @@ class SessionInfo:
 
 
 class AuthManager:
-    def __init__(self, db: Database, token_ttl_seconds: int = 12 * 60 * 60) -> None:
+    def __init__(
+        self,
+        db: Database,
+        token_ttl_seconds: int = 12 * 60 * 60,
+        *,
+        scrypt_log_n: int = 14,
+        scrypt_r: int = 8,
+        scrypt_p: int = 1,
+        kdf_algorithm: str = KDF_ARGON2ID,
+    ) -> None:
+        if kdf_algorithm not in {KDF_ARGON2ID, KDF_SCRYPT}:
+            raise ValueError(f"unsupported kdf algorithm: {kdf_algorithm}")
         self.db = db
         self.token_ttl_seconds = token_ttl_seconds
-        self._lock = threading.RLock()
+        self.scrypt_n = 2**scrypt_log_n
+        self.scrypt_r = scrypt_r
+        self.scrypt_p = scrypt_p
+        self.kdf_algorithm = kdf_algorithm
+        self._lock = threading.Lock()
         self._sessions: dict[str, SessionInfo] = {}
+        self._expiry_heap: list[tuple[int, str]] = []
+        self._last_gc = 0
+        self._token_key = os.urandom(32)
+        self._token_counter = itertools.count()
+        self._verify_cache_secret = os.urandom(32)
+        self._verify_cache: dict[bytes, float] = {}
+        self._parsed_hash: tuple[int, int, int, bytes, bytes] | None = None
+        self._parsed_hash_encoded: str | None = None
+        self._attempt_bucket: dict[str, deque[float]] = {}
+        self._last_bucket_gc = time.monotonic()
 
     def is_password_initialized(self) -> bool:
         return self.db.get_password_hash() is not None
 
     def bootstrap_password(self, password: str) -> bool:
-        encoded = hash_password(password)
+        encoded = self._hash_new_password(password)
         return self.db.insert_password_hash_once(encoded)
 
     def set_password(self, password: str) -> None:
-        encoded = hash_password(password)
+        encoded = self._hash_new_password(password)
         self.db.set_password_hash(encoded)
         self._clear_sessions()
 
-    def login(self, password: str) -> SessionInfo:
+    def login(self, password: str, client_ip: str | None = None) -> SessionInfo:
+        if client_ip is not None:
+            self._check_rate_limit(client_ip)
+
         encoded = self.db.get_password_hash()
         if encoded is None:
             raise PasswordNotInitialized("password is not initialized")
 
-        if not verify_password(password, encoded):
-            raise InvalidPassword("password mismatch")
-
-        token = secrets.token_urlsafe(32)
+        cache_key = self._verify_cache_key(password, encoded)
+        if not self._is_verified_cached(cache_key):
+            if not self._verify_encoded(password, encoded):
+                raise InvalidPassword("password mismatch")
+            if self._uses_argon2() and not encoded.startswith(ARGON2_PREFIX):
+                # legacy scrypt hash: upgrade in place without dropping live sessions
+                self.db.set_password_hash(hash_password_argon2(password))
+            else:
+                self._remember_verified(cache_key)
+
+        token = self._new_token()
         expires_at = int(time.time()) + self.token_ttl_seconds
         session = SessionInfo(token=token, expires_at=expires_at)
 
         with self._lock:
             self._gc_expired_locked()
             self._sessions[token] = session
+            heapq.heappush(self._expiry_heap, (expires_at, token))
         return session
 
     def verify_token(self, token: str) -> SessionInfo:
         now = int(time.time())
-        with self._lock:
-            self._gc_expired_locked(now=now)
-            session = self._sessions.get(token)
-            if session is None:
-                raise InvalidToken("invalid token")
-            if session.expires_at <= now:
+        if now - self._last_gc >= SESSION_GC_INTERVAL_SECONDS:
+            with self._lock:
+                if now - self._last_gc >= SESSION_GC_INTERVAL_SECONDS:
+                    self._gc_expired_locked(now=now)
+
+        # dict.get is atomic under the GIL and SessionInfo is immutable, so reads skip the lock
+        session = self._sessions.get(token)
+        if session is None:
+            raise InvalidToken("invalid token")
+        if session.expires_at <= now:
+            with self._lock:
                 self._sessions.pop(token, None)
-                raise InvalidToken("token expired")
-            return session
+            raise InvalidToken("token expired")
+        return session
 
     def _gc_expired_locked(self, now: int | None = None) -> None:
         current = now if now is not None else int(time.time())
-        expired = [tok for tok, sess in self._sessions.items() if sess.expires_at <= current]
-        for token in expired:
-            self._sessions.pop(token, None)
+        self._last_gc = current
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= current:
+            expires_at, token = heapq.heappop(heap)
+            session = self._sessions.get(token)
+            # stale heap entries (cleared sessions) no longer match the live session
+            if session is not None and session.expires_at == expires_at:
+                self._sessions.pop(token, None)
+
+    def _new_token(self) -> str:
+        # keyed blake2b over a counter: unguessable without the per-process key, no getrandom per login
+        nonce = next(self._token_counter).to_bytes(8, "big")
+        digest = hashlib.blake2b(nonce, key=self._token_key, digest_size=24).digest()
+        return _b64(digest).rstrip("=")
+
+    def _uses_argon2(self) -> bool:
+        return self.kdf_algorithm == KDF_ARGON2ID and argon2_available()
+
+    def _hash_new_password(self, password: str) -> str:
+        return hash_new_password(
+            password,
+            kdf=self.kdf_algorithm,
+            n=self.scrypt_n,
+            r=self.scrypt_r,
+            p=self.scrypt_p,
+        )
+
+    def _check_rate_limit(self, client_ip: str) -> None:
+        now = time.monotonic()
+        cutoff = now - LOGIN_RATE_WINDOW_SECONDS
+        with self._lock:
+            if now - self._last_bucket_gc >= LOGIN_RATE_GC_INTERVAL_SECONDS:
+                self._last_bucket_gc = now
+                stale = [ip for ip, bucket in self._attempt_bucket.items() if bucket[-1] <= cutoff]
+                for ip in stale:
+                    self._attempt_bucket.pop(ip, None)
+
+            bucket = self._attempt_bucket.setdefault(client_ip, deque())
+            while bucket and bucket[0] <= cutoff:
+                bucket.popleft()
+            if len(bucket) >= LOGIN_RATE_MAX_ATTEMPTS:
+                raise LoginRateLimited(f"too many login attempts from {client_ip}")
+            bucket.append(now)
+
+    def _verify_encoded(self, password: str, encoded: str) -> bool:
+        if encoded.startswith(ARGON2_PREFIX):
+            return verify_password_argon2(password, encoded)
+        parsed = self._get_parsed_hash(encoded)
+        return parsed is not None and _verify_parsed(password, parsed)
+
+    def _get_parsed_hash(self, encoded: str) -> tuple[int, int, int, bytes, bytes] | None:
+        with self._lock:
+            if encoded == self._parsed_hash_encoded:
+                return self._parsed_hash
+        parsed = _parse_encoded(encoded)
+        with self._lock:
+            self._parsed_hash = parsed
+            self._parsed_hash_encoded = encoded
+        return parsed
+
+    def _verify_cache_key(self, password: str, encoded: str) -> bytes:
+        # keyed by a per-process secret so cached entries never expose the password
+        message = encoded.encode("utf-8") + b"\x00" + password.encode("utf-8")
+        return hmac.new(self._verify_cache_secret, message, hashlib.sha256).digest()
+
+    def _is_verified_cached(self, cache_key: bytes) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            expires_at = self._verify_cache.get(cache_key)
+            if expires_at is None:
+                return False
+            if expires_at <= now:
+                self._verify_cache.pop(cache_key, None)
+                return False
+            return True
+
+    def _remember_verified(self, cache_key: bytes) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._verify_cache) >= VERIFY_CACHE_MAXSIZE:
+                expired = [key for key, expires_at in self._verify_cache.items() if expires_at <= now]
+                for key in expired:
+                    self._verify_cache.pop(key, None)
+                while len(self._verify_cache) >= VERIFY_CACHE_MAXSIZE:
+                    self._verify_cache.pop(next(iter(self._verify_cache)))
+            self._verify_cache[cache_key] = now + VERIFY_CACHE_TTL_SECONDS
 
     def _clear_sessions(self) -> None:
         with self._lock:
             self._sessions.clear()
+            self._expiry_heap.clear()
+            self._verify_cache.clear()
+            self._parsed_hash = None
+            self._parsed_hash_encoded = None
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable
 
 
 @dataclass(frozen=True)
@@ -21,6 +23,23 @@ class Settings:
 
 
 
+def _env_bool(raw: str) -> bool:
+    return raw not in {"0", "false", "False"}
+
+
+# (Settings field, env var, caster, default)
+_ENV_SCHEMA: tuple[tuple[str, str, Callable[[str], Any], str], ...] = (
+    ("http_host", "MODEL_MANAGER_HTTP_HOST", str, "0.0.0.0"),
+    ("http_port", "MODEL_MANAGER_HTTP_PORT", int, "6300"),
+    ("token_ttl_seconds", "MODEL_MANAGER_TOKEN_TTL", int, "43200"),
+    ("watch_enabled", "MODEL_MANAGER_WATCH_ENABLED", _env_bool, "1"),
+    ("watch_interval_seconds", "MODEL_MANAGER_WATCH_INTERVAL", int, "5"),
+    ("watch_debounce_seconds", "MODEL_MANAGER_WATCH_DEBOUNCE", int, "2"),
+)
+
+
+
+@functools.lru_cache(maxsize=None)
 def load_settings(base_dir: Path | None = None) -> Settings:
     root = base_dir or Path(__file__).resolve().parents[1]
     data_dir = root / "data"
@@ -30,16 +49,14 @@ def load_settings(base_dir: Path | None = None) -> Settings:
     data_dir.mkdir(parents=True, exist_ok=True)
     converted_model_dir.mkdir(parents=True, exist_ok=True)
 
+    env = os.environ.copy()
+    parsed = {name: caster(env.get(var, default)) for name, var, caster, default in _ENV_SCHEMA}
+
     return Settings(
         base_dir=root,
         data_dir=data_dir,
         db_path=data_dir / "model_manager.sqlite3",
         converted_model_dir=converted_model_dir,
         frontend_dir=frontend_dir,
-        http_host=os.getenv("MODEL_MANAGER_HTTP_HOST", "0.0.0.0"),
-        http_port=int(os.getenv("MODEL_MANAGER_HTTP_PORT", "6300")),
-        token_ttl_seconds=int(os.getenv("MODEL_MANAGER_TOKEN_TTL", "43200")),
-        watch_enabled=os.getenv("MODEL_MANAGER_WATCH_ENABLED", "1") not in {"0", "false", "False"},
-        watch_interval_seconds=int(os.getenv("MODEL_MANAGER_WATCH_INTERVAL", "5")),
-        watch_debounce_seconds=int(os.getenv("MODEL_MANAGER_WATCH_DEBOUNCE", "2")),
+        **parsed,
     )
@@ -3,7 +3,9 @@ from __future__ import annotations
 import argparse
 import os
 import pickle
-import tempfile
+import pickletools
+import stat
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +14,19 @@ class ModelConversionError(Exception):
     pass
 
 
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def writer_tmp_path(target: Path, suffix: str) -> Path:
+    # per-writer temp name (pid + thread) keeps the atomic rename without mkstemp's O_EXCL dance;
+    # shared with convert_xgb_to_onnx, kept here so this module still runs standalone
+    return target.with_name(f".{target.stem}.{os.getpid()}.{threading.get_ident()}.tmp{suffix}")
+
+
 def _load_pickle(path: Path) -> Any:
     try:
         with path.open("rb") as fh:
@@ -20,6 +35,59 @@ def _load_pickle(path: Path) -> Any:
         raise ModelConversionError(f"failed to load pickle '{path}': {exc}") from exc
 
 
+_STRING_OPS = frozenset({"SHORT_BINUNICODE", "BINUNICODE", "BINUNICODE8", "UNICODE"})
+_BYTES_OPS = frozenset({"SHORT_BINBYTES", "BINBYTES", "BINBYTES8", "BYTEARRAY8"})
+
+
+def _try_fast_extract(path: Path) -> bytes | None:
+    # Walk the pickle opcodes without executing them and pull out the raw model
+    # buffer stored under Booster.__getstate__()["handle"]; None means "use pickle.load".
+    try:
+        data = path.read_bytes()
+    except Exception:
+        return None
+
+    booster_seen = False
+    after_handle = False
+    blobs: list[bytes] = []
+    recent: list[str] = []
+    try:
+        for opcode, arg, _pos in pickletools.genops(data):
+            name = opcode.name
+            if name in _STRING_OPS:
+                recent = [recent[-1], arg] if recent else [arg]
+                if arg == "handle":
+                    after_handle = True
+            elif name == "STACK_GLOBAL":
+                if recent == ["xgboost.core", "Booster"]:
+                    booster_seen = True
+            elif name == "GLOBAL":
+                if arg == "xgboost.core Booster":
+                    booster_seen = True
+            elif name in _BYTES_OPS and after_handle:
+                blobs.append(bytes(arg))
+                after_handle = False
+    except Exception:
+        return None
+
+    if not booster_seen or len(blobs) != 1:
+        return None
+    return blobs[0]
+
+
+def _booster_from_raw(blob: bytes) -> Any | None:
+    try:
+        import xgboost as xgb  # type: ignore
+
+        # the "handle" buffer is Booster.__getstate__ output (model + config), not a
+        # load_model buffer; __setstate__ is the matching restore
+        booster = xgb.Booster()
+        booster.__setstate__({"handle": bytearray(blob)})
+    except Exception:
+        return None
+    return booster
+
+
 def _resolve_savable_model(obj: Any) -> Any:
     # 优先提取原生 Booster，避免 sklearn wrapper 的兼容性问题
     getter = getattr(obj, "get_booster", None)
@@ -59,30 +127,45 @@ def convert_pkl_to_xgb_json(
     source = Path(model_pkl_path).expanduser().resolve()
     target = Path(model_json_path).expanduser().resolve()
 
-    if not source.exists() or not source.is_file():
+    source_st = _stat_or_none(source)
+    if source_st is None or not stat.S_ISREG(source_st.st_mode):
         raise ModelConversionError(f"model.pkl not found: {source}")
 
-    if not force and target.exists() and target.is_file():
-        if target.stat().st_size > 0 and target.stat().st_mtime >= source.stat().st_mtime:
+    if not force:
+        target_st = _stat_or_none(target)
+        if (
+            target_st is not None
+            and stat.S_ISREG(target_st.st_mode)
+            and target_st.st_size > 0
+            and target_st.st_mtime_ns >= source_st.st_mtime_ns
+        ):
             return target
 
     target.parent.mkdir(parents=True, exist_ok=True)
 
-    payload = _load_pickle(source)
-    savable = _resolve_savable_model(payload)
+    savable = None
+    blob = _try_fast_extract(source)
+    if blob is not None:
+        savable = _booster_from_raw(blob)
+    if savable is None:
+        payload = _load_pickle(source)
+        savable = _resolve_savable_model(payload)
 
-    tmp_fd, tmp_name = tempfile.mkstemp(
-        prefix=f".{target.stem}.",
-        suffix=".tmp.json",
-        dir=str(target.parent),
-    )
-    os.close(tmp_fd)
-    tmp_path = Path(tmp_name)
+    tmp_path = writer_tmp_path(target, ".json")
+    tmp_path.unlink(missing_ok=True)
 
     try:
-        savable.save_model(str(tmp_path))
-        if not tmp_path.exists() or tmp_path.stat().st_size == 0:
-            raise ModelConversionError(f"xgboost save_model produced empty file: {tmp_path}")
+        # Booster.save_raw hands back the json buffer directly; save_model is the fallback
+        saver = getattr(savable, "save_raw", None)
+        raw = saver(raw_format="json") if callable(saver) else None
+        if raw is not None:
+            if len(raw) == 0:
+                raise ModelConversionError(f"xgboost save_raw produced empty json for: {source}")
+            tmp_path.write_bytes(raw)
+        else:
+            savable.save_model(str(tmp_path))
+            if not tmp_path.exists() or tmp_path.stat().st_size == 0:
+                raise ModelConversionError(f"xgboost save_model produced empty file: {tmp_path}")
         tmp_path.replace(target)
     except Exception as exc:
         if tmp_path.exists():
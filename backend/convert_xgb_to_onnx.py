@@ -1,23 +1,113 @@
 from __future__ import annotations
 
+import hashlib
 import os
-import tempfile
+import shutil
+import stat
 from pathlib import Path
 
+from .convert_pkl_to_xgb import writer_tmp_path
+
 
 class ModelOnnxConversionError(Exception):
     pass
 
 
-def _load_xgboost_booster(model_json_path: Path):
+# content-addressed ONNX results, keyed by sha256(model json) + feature dim
+ONNX_CACHE_MAX_ENTRIES = 256
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
     try:
-        import xgboost as xgb  # type: ignore
-    except Exception as exc:
-        raise ModelOnnxConversionError(
-            f"xgboost import failed, please install xgboost: {exc}"
-        ) from exc
+        return path.stat()
+    except OSError:
+        return None
 
-    booster = xgb.Booster()
+
+def _copy_atomic(src: Path, dst: Path) -> None:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = writer_tmp_path(dst, ".onnx")
+    try:
+        shutil.copyfile(src, tmp_path)
+        tmp_path.replace(dst)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def sha256_file_hex(path: Path) -> str:
+    with path.open("rb") as fh:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(fh, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _onnx_cache_path(cache_dir: Path, source: Path, feature_dim: int | None) -> Path | None:
+    try:
+        digest = sha256_file_hex(source)
+    except Exception:
+        return None  # the cache is optional; any hashing failure just means convert afresh
+    dim_token = str(feature_dim) if feature_dim is not None else "auto"
+    return cache_dir / f"{digest}_{dim_token}.onnx"
+
+
+def _restore_from_cache(cache_path: Path, target: Path) -> bool:
+    cache_st = _stat_or_none(cache_path)
+    if cache_st is None or cache_st.st_size == 0:
+        return False
+    try:
+        _copy_atomic(cache_path, target)
+        os.utime(cache_path)
+    except OSError:
+        return False
+    return True
+
+
+def _store_in_cache(cache_path: Path, target: Path) -> None:
+    try:
+        _copy_atomic(target, cache_path)
+        _evict_onnx_cache(cache_path.parent)
+    except OSError:
+        pass
+
+
+def _evict_onnx_cache(cache_dir: Path) -> None:
+    entries: list[tuple[int, str]] = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.startswith(".") or not entry.name.endswith(".onnx"):
+                continue
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry.path))
+            except OSError:
+                continue
+    if len(entries) <= ONNX_CACHE_MAX_ENTRIES:
+        return
+    entries.sort()
+    for _mtime_ns, path in entries[: len(entries) - ONNX_CACHE_MAX_ENTRIES]:
+        Path(path).unlink(missing_ok=True)
+
+
+_XGB = None
+
+
+def _xgb():
+    global _XGB
+    if _XGB is None:
+        try:
+            import xgboost as xgb  # type: ignore
+        except Exception as exc:
+            raise ModelOnnxConversionError(
+                f"xgboost import failed, please install xgboost: {exc}"
+            ) from exc
+        _XGB = xgb
+    return _XGB
+
+
+def _load_xgboost_booster(model_json_path: Path):
+    booster = _xgb().Booster()
     try:
         booster.load_model(str(model_json_path))
     except Exception as exc:
@@ -53,15 +143,29 @@ def convert_xgb_json_to_onnx(
     *,
     feature_dim: int | None = None,
     force: bool = False,
+    cache_dir: str | Path | None = None,
 ) -> Path:
     source = Path(model_json_path).expanduser().resolve()
     target = Path(model_onnx_path).expanduser().resolve()
 
-    if not source.exists() or not source.is_file():
+    source_st = _stat_or_none(source)
+    if source_st is None or not stat.S_ISREG(source_st.st_mode):
         raise ModelOnnxConversionError(f"xgboost model json not found: {source}")
 
-    if not force and target.exists() and target.is_file():
-        if target.stat().st_size > 0 and target.stat().st_mtime >= source.stat().st_mtime:
+    if not force:
+        target_st = _stat_or_none(target)
+        if (
+            target_st is not None
+            and stat.S_ISREG(target_st.st_mode)
+            and target_st.st_size > 0
+            and target_st.st_mtime_ns >= source_st.st_mtime_ns
+        ):
+            return target
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = _onnx_cache_path(Path(cache_dir).expanduser().resolve(), source, feature_dim)
+        if cache_path is not None and _restore_from_cache(cache_path, target):
             return target
 
     booster = _load_xgboost_booster(source)
@@ -78,13 +182,8 @@ def convert_xgb_json_to_onnx(
 
     target.parent.mkdir(parents=True, exist_ok=True)
 
-    tmp_fd, tmp_name = tempfile.mkstemp(
-        prefix=f".{target.stem}.",
-        suffix=".tmp.onnx",
-        dir=str(target.parent),
-    )
-    os.close(tmp_fd)
-    tmp_path = Path(tmp_name)
+    tmp_path = writer_tmp_path(target, ".onnx")
+    tmp_path.unlink(missing_ok=True)
 
     try:
         onnx_model = convert_xgboost(
@@ -109,4 +208,6 @@ def convert_xgb_json_to_onnx(
             f"failed to convert xgboost json to onnx from '{source}' -> '{target}': {exc}"
         ) from exc
 
+    if cache_path is not None:
+        _store_in_cache(cache_path, target)
     return target
@@ -2,17 +2,98 @@ from __future__ import annotations
 
 import sqlite3
 import threading
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 
+# Statements live at module level so each connection's statement cache keys on the same text.
+_SQL_SCHEMA = """
+PRAGMA journal_mode=WAL;
+
+CREATE TABLE IF NOT EXISTS auth_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    password_hash TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS model_repo (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    model_name TEXT NOT NULL UNIQUE,
+    root_path TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS model_scan_state (
+    model_name TEXT PRIMARY KEY,
+    root_path TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+_SQL_GET_PASSWORD_HASH = "SELECT password_hash FROM auth_state WHERE id = 1"
+
+_SQL_UPSERT_PASSWORD_HASH = """
+INSERT INTO auth_state(id, password_hash, updated_at)
+VALUES (1, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    password_hash = excluded.password_hash,
+    updated_at = excluded.updated_at
+"""
+
+_SQL_HAS_PASSWORD_HASH = "SELECT 1 FROM auth_state WHERE id = 1"
+
+_SQL_INSERT_PASSWORD_HASH = "INSERT INTO auth_state(id, password_hash, updated_at) VALUES (1, ?, ?)"
+
+_SQL_UPSERT_MODEL = """
+INSERT INTO model_repo(model_name, root_path, created_at, updated_at)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(model_name) DO UPDATE SET
+    root_path = excluded.root_path,
+    updated_at = excluded.updated_at
+"""
+
+_SQL_GET_MODEL = """
+SELECT model_name, root_path, created_at, updated_at
+FROM model_repo
+WHERE model_name = ?
+"""
+
+_SQL_LIST_MODELS = """
+SELECT model_name, root_path, created_at, updated_at
+FROM model_repo
+ORDER BY model_name ASC
+"""
+
+_SQL_DELETE_MODEL = "DELETE FROM model_repo WHERE model_name = ?"
+
+_SQL_GET_SCAN_STATE = "SELECT root_path, payload FROM model_scan_state WHERE model_name = ?"
+
+_SQL_UPSERT_SCAN_STATE = """
+INSERT INTO model_scan_state(model_name, root_path, payload, updated_at)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(model_name) DO UPDATE SET
+    root_path = excluded.root_path,
+    payload = excluded.payload,
+    updated_at = excluded.updated_at
+"""
+
+_SQL_DELETE_SCAN_STATE = "DELETE FROM model_scan_state WHERE model_name = ?"
+
+
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    # same text as datetime.now(timezone.utc).replace(microsecond=0).isoformat(), minus the datetime
+    g = time.gmtime()
+    return (
+        f"{g.tm_year:04d}-{g.tm_mon:02d}-{g.tm_mday:02d}"
+        f"T{g.tm_hour:02d}:{g.tm_min:02d}:{g.tm_sec:02d}+00:00"
+    )
 
 
-@dataclass
+@dataclass(frozen=True)
 class RegisteredModel:
     model_name: str
     root_path: str
@@ -23,131 +104,149 @@ class RegisteredModel:
 class Database:
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writer_conn: sqlite3.Connection | None = None
+        # model_repo read caches; only this process writes the table, so writes invalidate them
+        self._model_cache: dict[str, RegisteredModel] = {}
+        self._list_cache: list[RegisteredModel] | None = None
+        self._cache_generation = 0
+        # auth_state holds a single row; remember it once seen (absence is not cached)
+        self._password_hash_cache: str | None = None
 
     def initialize(self) -> None:
-        with self._connect() as conn:
-            conn.executescript(
-                """
-                PRAGMA journal_mode=WAL;
-
-                CREATE TABLE IF NOT EXISTS auth_state (
-                    id INTEGER PRIMARY KEY CHECK (id = 1),
-                    password_hash TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                );
-
-                CREATE TABLE IF NOT EXISTS model_repo (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    model_name TEXT NOT NULL UNIQUE,
-                    root_path TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                );
-
-                """
-            )
-
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        with self._lock, self._writer() as conn:
+            conn.executescript(_SQL_SCHEMA)
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=512)
         conn.row_factory = sqlite3.Row
+        # synchronous/cache/mmap/busy_timeout are per-connection, so apply them on every open
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA busy_timeout=5000")
         return conn
 
+    def _reader(self) -> sqlite3.Connection:
+        # one long-lived read connection per thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+        return conn
+
+    def _invalidate_model_cache(self) -> None:
+        # callers hold self._lock; bumping the generation stops in-flight reads from re-filling stale rows
+        self._cache_generation += 1
+        self._model_cache = {}
+        self._list_cache = None
+
+    def _writer(self) -> sqlite3.Connection:
+        # single shared write connection; callers must hold self._lock (readers never take it)
+        if self._writer_conn is None:
+            self._writer_conn = self._open()
+        return self._writer_conn
+
     def get_password_hash(self) -> str | None:
-        with self._lock, self._connect() as conn:
-            row = conn.execute("SELECT password_hash FROM auth_state WHERE id = 1").fetchone()
-            return None if row is None else str(row["password_hash"])
+        cached = self._password_hash_cache
+        if cached is not None:
+            return cached
+
+        with self._reader() as conn:
+            row = conn.execute(_SQL_GET_PASSWORD_HASH).fetchone()
+        if row is None:
+            return None
+        password_hash = str(row["password_hash"])
+        with self._lock:
+            # a concurrent set_password_hash may already have stored a newer value
+            if self._password_hash_cache is None:
+                self._password_hash_cache = password_hash
+        return password_hash
 
     def set_password_hash(self, password_hash: str) -> None:
         now = utc_now_iso()
-        with self._lock, self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO auth_state(id, password_hash, updated_at)
-                VALUES (1, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET
-                    password_hash = excluded.password_hash,
-                    updated_at = excluded.updated_at
-                """,
-                (password_hash, now),
-            )
+        with self._lock, self._writer() as conn:
+            conn.execute(_SQL_UPSERT_PASSWORD_HASH, (password_hash, now))
             conn.commit()
+            self._password_hash_cache = password_hash
 
     def insert_password_hash_once(self, password_hash: str) -> bool:
         now = utc_now_iso()
-        with self._lock, self._connect() as conn:
-            row = conn.execute("SELECT 1 FROM auth_state WHERE id = 1").fetchone()
+        with self._lock, self._writer() as conn:
+            # take the write lock up front so check + insert commit as one transaction
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(_SQL_HAS_PASSWORD_HASH).fetchone()
             if row is not None:
+                conn.rollback()
                 return False
 
-            conn.execute(
-                "INSERT INTO auth_state(id, password_hash, updated_at) VALUES (1, ?, ?)",
-                (password_hash, now),
-            )
+            conn.execute(_SQL_INSERT_PASSWORD_HASH, (password_hash, now))
             conn.commit()
+            self._password_hash_cache = password_hash
             return True
 
     def upsert_model(self, model_name: str, root_path: str) -> None:
         now = utc_now_iso()
-        with self._lock, self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO model_repo(model_name, root_path, created_at, updated_at)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(model_name) DO UPDATE SET
-                    root_path = excluded.root_path,
-                    updated_at = excluded.updated_at
-                """,
-                (model_name, root_path, now, now),
-            )
+        with self._lock, self._writer() as conn:
+            conn.execute(_SQL_UPSERT_MODEL, (model_name, root_path, now, now))
             conn.commit()
+            self._invalidate_model_cache()
 
     def get_model(self, model_name: str) -> RegisteredModel | None:
-        with self._lock, self._connect() as conn:
-            row = conn.execute(
-                """
-                SELECT model_name, root_path, created_at, updated_at
-                FROM model_repo
-                WHERE model_name = ?
-                """,
-                (model_name,),
-            ).fetchone()
-            if row is None:
-                return None
-            return RegisteredModel(
-                model_name=str(row["model_name"]),
-                root_path=str(row["root_path"]),
-                created_at=str(row["created_at"]),
-                updated_at=str(row["updated_at"]),
-            )
+        cached = self._model_cache.get(model_name)
+        if cached is not None:
+            return cached
+
+        generation = self._cache_generation
+        with self._reader() as conn:
+            row = conn.execute(_SQL_GET_MODEL, (model_name,)).fetchone()
+        # SELECT column order matches the RegisteredModel field order
+        if row is None:
+            # misses are not cached: names come straight from request URLs and would grow it unbounded
+            return None
+        item = RegisteredModel(*row)
+        with self._lock:
+            if generation == self._cache_generation:
+                self._model_cache[model_name] = item
+        return item
 
     def list_models(self) -> list[RegisteredModel]:
-        with self._lock, self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT model_name, root_path, created_at, updated_at
-                FROM model_repo
-                ORDER BY model_name ASC
-                """
-            ).fetchall()
-        return [
-            RegisteredModel(
-                model_name=str(row["model_name"]),
-                root_path=str(row["root_path"]),
-                created_at=str(row["created_at"]),
-                updated_at=str(row["updated_at"]),
-            )
-            for row in rows
-        ]
+        cached = self._list_cache
+        if cached is not None:
+            return list(cached)
+
+        generation = self._cache_generation
+        with self._reader() as conn:
+            rows = conn.execute(_SQL_LIST_MODELS).fetchall()
+        items = [RegisteredModel(*row) for row in rows]
+        with self._lock:
+            if generation == self._cache_generation:
+                self._list_cache = items
+        return list(items)
 
     def delete_model(self, model_name: str) -> bool:
-        with self._lock, self._connect() as conn:
-            cursor = conn.execute(
-                "DELETE FROM model_repo WHERE model_name = ?",
-                (model_name,),
-            )
+        with self._lock, self._writer() as conn:
+            cursor = conn.execute(_SQL_DELETE_MODEL, (model_name,))
+            conn.execute(_SQL_DELETE_SCAN_STATE, (model_name,))
             conn.commit()
+            self._invalidate_model_cache()
             return cursor.rowcount > 0
 
+    def get_scan_state(self, model_name: str) -> tuple[str, bytes] | None:
+        with self._reader() as conn:
+            row = conn.execute(_SQL_GET_SCAN_STATE, (model_name,)).fetchone()
+        if row is None:
+            return None
+        return str(row["root_path"]), bytes(row["payload"])
+
+    def save_scan_state(self, model_name: str, root_path: str, payload: bytes) -> None:
+        now = utc_now_iso()
+        with self._lock, self._writer() as conn:
+            conn.execute(_SQL_UPSERT_SCAN_STATE, (model_name, root_path, payload, now))
+            conn.commit()
+
     def as_dicts(self) -> list[dict[str, Any]]:
         return [item.__dict__.copy() for item in self.list_models()]
@@ -6,6 +6,11 @@ import logging
 
 import uvicorn
 
+try:
+    import uvloop  # type: ignore
+except ImportError:  # optional: fall back to the stdlib event loop
+    uvloop = None
+
 from .config import load_settings
 from .db import Database
 from .registry import ModelRegistry
@@ -69,7 +74,12 @@ async def async_main(args: argparse.Namespace) -> int:
     LOG.info("creating FastAPI app...")
     app = create_app(settings=settings, registry=registry)
 
-    config = uvicorn.Config(app=app, host=http_host, port=http_port, log_level="info")
+    config = uvicorn.Config(
+        app=app,
+        host=http_host,
+        port=http_port,
+        log_level="info",
+    )
     server = uvicorn.Server(config)
 
     LOG.info("HTTP started at %s:%s", http_host, http_port)
@@ -89,6 +99,9 @@ async def async_main(args: argparse.Namespace) -> int:
 
 def main() -> None:
     args = parse_args()
+    if uvloop is not None:
+        # Server.serve() runs on the caller's loop and ignores Config.loop, so the policy is what selects uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
         code = asyncio.run(async_main(args))
     except KeyboardInterrupt:
@@ -1,13 +1,35 @@
 from __future__ import annotations
 
+import copy
 import csv
+import functools
 import json
+import mmap
+import os
 import pickle
+import time
 from collections import defaultdict
-from dataclasses import asdict, dataclass, field
-from datetime import datetime, timezone
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional: stdlib json handles everything, just slower
+    orjson = None
+
+try:
+    import ijson  # type: ignore
+except ImportError:  # optional: large model.json files are then fully parsed
+    ijson = None
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.compute as pa_compute  # type: ignore
+    import pyarrow.csv as pa_csv  # type: ignore
+except ImportError:  # optional: IC csvs are then read with the csv module
+    pa = None
 
 ARTIFACT_SUFFIXES: dict[str, str] = {
     "factors_txt": "_factors.txt",
@@ -18,22 +40,89 @@ ARTIFACT_SUFFIXES: dict[str, str] = {
     "model_onnx": "_model.onnx",
 }
 
+# per-group parsing fan-out in scan_model_root
+SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# model.json files at least this large are streamed for the few header fields we read;
+# streaming is slower than orjson per byte but keeps peak memory flat on huge tree dumps
+MODEL_JSON_STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+# IC csvs at least this large go through pyarrow's reader instead of csv.DictReader
+IC_CSV_ARROW_MIN_BYTES = 64 * 1024
+
+# bump when SymbolRecord.to_dict or the group fingerprint changes shape; older blobs are ignored
+SCAN_STATE_VERSION = 1
+
+
+def _index_suffixes_by_ext() -> dict[str, tuple[tuple[str, str], ...]]:
+    index: dict[str, tuple[tuple[str, str], ...]] = {}
+    for kind, suffix in ARTIFACT_SUFFIXES.items():
+        ext = suffix[suffix.rfind("."):]
+        index[ext] = (*index.get(ext, ()), (suffix, kind))
+    return index
+
+
+# extension -> candidate (suffix, kind) pairs; most names resolve with one dict miss
+_SUFFIXES_BY_EXT = _index_suffixes_by_ext()
 
-@dataclass
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# SymbolRecord fields exposed by the symbol list API, in response key order
+SYMBOL_LIST_FIELDS = (
+    "symbol",
+    "group_key",
+    "return_name",
+    "feature_dim",
+    "factor_count",
+    "grpc_ready",
+    "train_start_date",
+    "train_end_date",
+    "warnings",
+)
+
+
+def _copy_tree(value: Any) -> Any:
+    # what dataclasses.asdict does to non-dataclass values: fresh dicts/lists, deepcopy the rest
+    kind = type(value)
+    if kind is dict:
+        return {k: _copy_tree(v) for k, v in value.items()}
+    if kind is list:
+        return [_copy_tree(v) for v in value]
+    if kind in _SCALAR_TYPES:
+        return value
+    return copy.deepcopy(value)
+
+
+@dataclass(slots=True)
 class ArtifactFileMeta:
     path: str
     size_bytes: int
     modified_at: str
 
+    def to_dict(self) -> dict[str, Any]:
+        return {"path": self.path, "size_bytes": self.size_bytes, "modified_at": self.modified_at}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ArtifactFileMeta:
+        return cls(data["path"], data["size_bytes"], data["modified_at"])
+
 
-@dataclass
+@dataclass(slots=True)
 class DimFactor:
     dim: int
     factor_name: str
     kendall_tau: float | None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {"dim": self.dim, "factor_name": self.factor_name, "kendall_tau": self.kendall_tau}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DimFactor:
+        return cls(data["dim"], data["factor_name"], data["kendall_tau"])
+
 
-@dataclass
+@dataclass(slots=True)
 class SymbolRecord:
     symbol: str
     group_key: str
@@ -54,14 +143,61 @@ class SymbolRecord:
     model_meta: dict[str, Any]
     artifacts: dict[str, ArtifactFileMeta]
     warnings: list[str] = field(default_factory=list)
+    # symbol.strip().upper(), computed once at scan time for registry lookups; not serialized
+    symbol_norm: str = ""
 
     def to_dict(self) -> dict[str, Any]:
-        raw = asdict(self)
-        raw["dim_factors"] = [asdict(item) for item in self.dim_factors]
-        return raw
+        # spelled out instead of dataclasses.asdict: this runs per symbol on every snapshot dump
+        return {
+            "symbol": self.symbol,
+            "group_key": self.group_key,
+            "return_name": self.return_name,
+            "feature_dim": self.feature_dim,
+            "factor_count": self.factor_count,
+            "grpc_ready": self.grpc_ready,
+            "train_window_start_ts": self.train_window_start_ts,
+            "train_window_end_ts": self.train_window_end_ts,
+            "train_start_date": self.train_start_date,
+            "train_end_date": self.train_end_date,
+            "train_samples": self.train_samples,
+            "train_time_sec": self.train_time_sec,
+            "factors": list(self.factors),
+            "dim_factors": [item.to_dict() for item in self.dim_factors],
+            "ic_rows": _copy_tree(self.ic_rows),
+            "info_summary": _copy_tree(self.info_summary),
+            "model_meta": _copy_tree(self.model_meta),
+            "artifacts": {key: item.to_dict() for key, item in self.artifacts.items()},
+            "warnings": list(self.warnings),
+        }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SymbolRecord:
+        # inverse of to_dict; symbol_norm is derived, so it is recomputed rather than stored
+        return cls(
+            symbol=data["symbol"],
+            group_key=data["group_key"],
+            return_name=data["return_name"],
+            feature_dim=data["feature_dim"],
+            factor_count=data["factor_count"],
+            grpc_ready=data["grpc_ready"],
+            train_window_start_ts=data["train_window_start_ts"],
+            train_window_end_ts=data["train_window_end_ts"],
+            train_start_date=data["train_start_date"],
+            train_end_date=data["train_end_date"],
+            train_samples=data["train_samples"],
+            train_time_sec=data["train_time_sec"],
+            factors=data["factors"],
+            dim_factors=[DimFactor.from_dict(item) for item in data["dim_factors"]],
+            ic_rows=data["ic_rows"],
+            info_summary=data["info_summary"],
+            model_meta=data["model_meta"],
+            artifacts={key: ArtifactFileMeta.from_dict(item) for key, item in data["artifacts"].items()},
+            warnings=data["warnings"],
+            symbol_norm=data["symbol"].strip().upper(),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class ModelSnapshot:
     model_name: str
     root_path: str
@@ -70,6 +206,10 @@ class ModelSnapshot:
     group_count: int
     warnings: list[str]
     symbols: list[SymbolRecord]
+    # first-seen-order distinct factor names across all symbols; derived, not serialized
+    unique_factors: tuple[str, ...] = ()
+    # one tuple per SYMBOL_LIST_FIELDS entry, aligned with symbols; backs the symbol list API
+    symbol_columns: tuple[tuple[Any, ...], ...] = ()
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -84,12 +224,28 @@ class ModelSnapshot:
 
 
 
+def _utc_iso(seconds: float | None = None) -> str:
+    # second-resolution "+00:00" ISO text, same as datetime(..., timezone.utc).isoformat()
+    g = time.gmtime(seconds)
+    return (
+        f"{g.tm_year:04d}-{g.tm_mon:02d}-{g.tm_mday:02d}"
+        f"T{g.tm_hour:02d}:{g.tm_min:02d}:{g.tm_sec:02d}+00:00"
+    )
+
+
+
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    return _utc_iso()
 
 
 
 def _safe_float(raw: Any) -> float | None:
+    # exact-type fast paths skip the try/compare for the common numeric inputs
+    kind = type(raw)
+    if kind is float:
+        return raw
+    if kind is int:
+        return float(raw)
     try:
         if raw is None or raw == "":
             return None
@@ -100,6 +256,8 @@ def _safe_float(raw: Any) -> float | None:
 
 
 def _safe_int(raw: Any) -> int | None:
+    if type(raw) is int:
+        return raw
     try:
         if raw is None or raw == "":
             return None
@@ -121,7 +279,40 @@ def _as_iso(raw: Any) -> str | None:
 
 
 
+def _jsonable_identity(value: Any) -> Any:
+    return value
+
+
+
+def _jsonable_dict(value: dict[Any, Any]) -> dict[str, Any]:
+    return {str(k): _jsonable(v) for k, v in value.items()}
+
+
+
+def _jsonable_seq(value: Any) -> list[Any]:
+    return [_jsonable(v) for v in value]
+
+
+
+# exact-type fast path for _jsonable; subclasses and everything else take the isinstance chain
+_JSONABLE_DISPATCH: dict[type, Callable[[Any], Any]] = {
+    str: _jsonable_identity,
+    int: _jsonable_identity,
+    float: _jsonable_identity,
+    bool: _jsonable_identity,
+    type(None): _jsonable_identity,
+    dict: _jsonable_dict,
+    list: _jsonable_seq,
+    tuple: _jsonable_seq,
+    set: _jsonable_seq,
+}
+
+
+
 def _jsonable(value: Any) -> Any:
+    handler = _JSONABLE_DISPATCH.get(type(value))
+    if handler is not None:
+        return handler(value)
     if value is None or isinstance(value, (bool, int, float, str)):
         return value
     if isinstance(value, Path):
@@ -146,15 +337,16 @@ def _jsonable(value: Any) -> Any:
 
 
 
-def _file_meta(path: Path | None) -> ArtifactFileMeta | None:
-    if path is None or not path.exists() or not path.is_file():
-        return None
-    stat = path.stat()
-    modified = datetime.fromtimestamp(stat.st_mtime, timezone.utc).replace(microsecond=0)
+def _file_meta(path: Path | None, stat: os.stat_result | None = None) -> ArtifactFileMeta | None:
+    # `stat` comes from the scandir walk when available, saving the exists/is_file/stat trio
+    if stat is None:
+        if path is None or not path.exists() or not path.is_file():
+            return None
+        stat = path.stat()
     return ArtifactFileMeta(
         path=str(path),
         size_bytes=int(stat.st_size),
-        modified_at=modified.isoformat(),
+        modified_at=_utc_iso(stat.st_mtime_ns // 1_000_000_000),
     )
 
 
@@ -177,12 +369,63 @@ def _parse_factors_txt(path: Path | None) -> tuple[list[str], list[str]]:
 
 
 
-def _parse_ic_csv(path: Path | None) -> tuple[list[dict[str, Any]], list[str]]:
+_IC_STR_COLUMNS = ("symbol", "factor_name", "return_name")
+
+
+
+def _read_ic_csv_arrow(path: Path) -> list[dict[str, Any]] | None:
+    # columnar parse with the same row shape as the DictReader path; anything pyarrow
+    # rejects (ragged rows, non-numeric taus, ...) returns None so the csv module decides
+    column_types = {name: pa.string() for name in _IC_STR_COLUMNS}
+    column_types["Kendall_tau"] = pa.float64()
+    try:
+        table = pa_csv.read_csv(
+            str(path),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                null_values=[""],
+                strings_can_be_null=False,
+                include_columns=[*_IC_STR_COLUMNS, "Kendall_tau"],
+                include_missing_columns=True,
+            ),
+        )
+        symbols, factor_names, return_names = (
+            pa_compute.utf8_trim_whitespace(pa_compute.fill_null(table[name], "")).to_pylist()
+            for name in _IC_STR_COLUMNS
+        )
+        taus = table["Kendall_tau"].to_pylist()
+    except Exception:
+        return None
+    return [
+        {
+            "symbol": symbol,
+            "factor_name": factor_name,
+            "return_name": return_name,
+            "Kendall_tau": kendall_tau,
+        }
+        for symbol, factor_name, return_name, kendall_tau in zip(
+            symbols, factor_names, return_names, taus
+        )
+    ]
+
+
+
+def _parse_ic_csv(
+    path: Path | None,
+    size_bytes: int | None = None,
+) -> tuple[list[dict[str, Any]], list[str]]:
     if path is None or not path.exists():
         return [], []
 
     warnings: list[str] = []
-    rows: list[dict[str, Any]] = []
+    if pa is not None and (size_bytes or 0) >= IC_CSV_ARROW_MIN_BYTES:
+        rows = _read_ic_csv_arrow(path)
+        if rows is not None:
+            if not rows:
+                warnings.append(f"{path.name} exists but has no IC rows")
+            return rows, warnings
+
+    rows = []
 
     with path.open("r", encoding="utf-8", newline="") as fh:
         reader = csv.DictReader(fh)
@@ -206,6 +449,53 @@ def _parse_ic_csv(path: Path | None) -> tuple[list[dict[str, Any]], list[str]]:
 
 
 
+def _load_pickle_mapped(path: Path) -> Any:
+    # unpickle straight from a read-only mapping instead of many buffered read() calls;
+    # empty/unmappable files fall back to pickle.load so errors read the same as before
+    with path.open("rb") as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return pickle.load(fh)
+        with mm:
+            return pickle.loads(mm)
+
+
+
+def _ic_rows_from_frame(ic_df: Any) -> list[dict[str, Any]] | None:
+    # read the four IC columns straight off a DataFrame instead of building a dict per
+    # row via to_dict("records"); None sends the caller down the records path
+    columns = getattr(ic_df, "columns", None)
+    if columns is None or not getattr(columns, "is_unique", False):
+        return None
+    try:
+        count = len(ic_df)
+
+        def text_column(name: str) -> list[str]:
+            if name not in columns:
+                return [""] * count
+            return [str(value) for value in ic_df[name].tolist()]
+
+        symbols = text_column("symbol")
+        factor_names = text_column("factor_name")
+        return_names = text_column("return_name")
+        taus = ic_df["Kendall_tau"].tolist() if "Kendall_tau" in columns else [None] * count
+    except Exception:
+        return None
+    return [
+        {
+            "symbol": symbol,
+            "factor_name": factor_name,
+            "return_name": return_name,
+            "Kendall_tau": _safe_float(kendall_tau),
+        }
+        for symbol, factor_name, return_name, kendall_tau in zip(
+            symbols, factor_names, return_names, taus
+        )
+    ]
+
+
+
 def _parse_info_pkl(path: Path | None) -> tuple[dict[str, Any], list[str], list[dict[str, Any]], list[str]]:
     if path is None or not path.exists():
         return {}, [], [], []
@@ -215,8 +505,7 @@ def _parse_info_pkl(path: Path | None) -> tuple[dict[str, Any], list[str], list[
     ic_rows: list[dict[str, Any]] = []
 
     try:
-        with path.open("rb") as fh:
-            obj = pickle.load(fh)
+        obj = _load_pickle_mapped(path)
     except Exception as exc:
         warnings.append(f"failed to parse {path.name}: {exc}")
         return {}, [], [], warnings
@@ -232,7 +521,10 @@ def _parse_info_pkl(path: Path | None) -> tuple[dict[str, Any], list[str], list[
         selected_factors.append(str(item))
 
     ic_df = obj.get("ic_df")
-    if ic_df is not None and hasattr(ic_df, "to_dict"):
+    frame_rows = _ic_rows_from_frame(ic_df) if ic_df is not None else None
+    if frame_rows is not None:
+        ic_rows = frame_rows
+    elif ic_df is not None and hasattr(ic_df, "to_dict"):
         try:
             records = ic_df.to_dict(orient="records")
             for record in records:
@@ -275,13 +567,69 @@ def _parse_info_pkl(path: Path | None) -> tuple[dict[str, Any], list[str], list[
 
 
 
-def _parse_model_json(path: Path | None) -> tuple[dict[str, Any], list[str]]:
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals, which only the stdlib parser accepts
+    return json.loads(data)
+
+
+
+_MODEL_JSON_STREAM_FIELDS: dict[str, tuple[str, ...]] = {
+    "learner.learner_model_param.num_feature": ("learner", "learner_model_param", "num_feature"),
+    "learner.objective.name": ("learner", "objective", "name"),
+    "learner.gradient_booster.model.gbtree_model_param.num_trees": (
+        "learner", "gradient_booster", "model", "gbtree_model_param", "num_trees",
+    ),
+    "learner.gradient_booster.model.gbtree_model_param.num_parallel_tree": (
+        "learner", "gradient_booster", "model", "gbtree_model_param", "num_parallel_tree",
+    ),
+}
+
+
+
+def _stream_model_json_header(path: Path) -> dict[str, Any]:
+    # pull only the fields _parse_model_json reads, rebuilt into the same nested shape,
+    # so the tree arrays are tokenized but never materialized
+    payload: dict[str, Any] = {}
+    version: list[Any] = []
+    with path.open("rb") as fh:
+        for prefix, _event, value in ijson.parse(fh, use_float=True):
+            if prefix == "version.item":
+                version.append(value)
+                continue
+            keys = _MODEL_JSON_STREAM_FIELDS.get(prefix)
+            if keys is None:
+                continue
+            node = payload
+            for key in keys[:-1]:
+                node = node.setdefault(key, {})
+            node[keys[-1]] = value
+    if version:
+        payload["version"] = version
+    return payload
+
+
+
+def _parse_model_json(
+    path: Path | None,
+    size_bytes: int | None = None,
+) -> tuple[dict[str, Any], list[str]]:
     if path is None or not path.exists():
         return {}, []
 
     warnings: list[str] = []
+    payload = None
+    if ijson is not None and (size_bytes or 0) >= MODEL_JSON_STREAM_MIN_BYTES:
+        try:
+            payload = _stream_model_json_header(path)
+        except Exception:
+            payload = None  # let the full parse below produce the warning
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload is None:
+            payload = _json_loads(path.read_bytes())
     except Exception as exc:
         warnings.append(f"failed to parse {path.name}: {exc}")
         return {}, warnings
@@ -305,135 +653,321 @@ def _parse_model_json(path: Path | None) -> tuple[dict[str, Any], list[str]]:
 
 
 
+@functools.lru_cache(maxsize=4096)
+def _derive_parts(group_key: str) -> tuple[str, str]:
+    # "<symbol>_<return_name>" fallback naming; group keys repeat across rescans
+    head, sep, tail = group_key.partition("_")
+    return head, tail if sep else ""
+
+
+
 def _derive_symbol(group_key: str) -> str:
-    head, *_ = group_key.split("_", maxsplit=1)
-    return head
+    return _derive_parts(group_key)[0]
 
 
 
 def _derive_return_name(group_key: str) -> str:
-    parts = group_key.split("_", maxsplit=1)
-    if len(parts) < 2:
-        return ""
-    return parts[1]
+    return _derive_parts(group_key)[1]
 
 
 
-def scan_model_root(model_name: str, root_path: str) -> ModelSnapshot:
-    root = Path(root_path).expanduser().resolve()
-    if not root.exists() or not root.is_dir():
-        raise ValueError(f"model root path not found or not directory: {root}")
-
-    grouped: dict[str, dict[str, Path]] = defaultdict(dict)
-    for file_path in root.rglob("*"):
-        if not file_path.is_file():
+def _iter_files(root: Path):
+    # iterative scandir walk; DirEntry answers is_file/is_dir from d_type without extra stats.
+    # Like rglob, symlinked directories are not descended into.
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
             continue
-        file_name = file_path.name
-        for kind, suffix in ARTIFACT_SUFFIXES.items():
-            if file_name.endswith(suffix):
-                grouped[file_name[: -len(suffix)]][kind] = file_path
-                break
-
-    records: list[SymbolRecord] = []
-    scan_warnings: list[str] = []
-
-    for group_key in sorted(grouped.keys()):
-        file_map = grouped[group_key]
-
-        factors, factor_warn = _parse_factors_txt(file_map.get("factors_txt"))
-        ic_rows_csv, ic_warn = _parse_ic_csv(file_map.get("ic_csv"))
-        info_summary, factors_info, ic_rows_info, info_warn = _parse_info_pkl(file_map.get("info_pkl"))
-        model_meta, model_warn = _parse_model_json(file_map.get("model_json"))
-
-        warnings = [*factor_warn, *ic_warn, *info_warn, *model_warn]
-
-        if not factors and factors_info:
-            factors = list(factors_info)
-        ic_rows = ic_rows_csv if ic_rows_csv else ic_rows_info
-
-        symbol = str(info_summary.get("symbol") or "").strip()
-        if not symbol and ic_rows:
-            symbol = str(ic_rows[0].get("symbol") or "").strip()
-        if not symbol:
-            symbol = _derive_symbol(group_key)
-
-        return_name = str(info_summary.get("return_name") or "").strip()
-        if not return_name and ic_rows:
-            return_name = str(ic_rows[0].get("return_name") or "").strip()
-        if not return_name:
-            return_name = _derive_return_name(group_key)
-
-        feature_dim = int(model_meta.get("feature_dim") or 0)
-        if feature_dim <= 0:
-            feature_dim = len(factors)
-
-        if feature_dim <= 0:
-            warnings.append(f"{group_key}: feature dimension unresolved")
-
-        if factors and feature_dim and len(factors) != feature_dim:
-            warnings.append(
-                f"{group_key}: factors count {len(factors)} differs from feature_dim {feature_dim}"
-            )
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+
+
+
+def _classify_artifact(file_name: str) -> tuple[str, str] | None:
+    dot = file_name.rfind(".")
+    if dot < 0:
+        return None
+    for suffix, kind in _SUFFIXES_BY_EXT.get(file_name[dot:], ()):
+        if file_name.endswith(suffix):
+            return file_name[: -len(suffix)], kind
+    return None
+
+
+
+def _build_symbol_record(
+    group_key: str,
+    file_map: dict[str, Path],
+    file_stats: dict[str, os.stat_result],
+) -> SymbolRecord:
+    factors, factor_warn = _parse_factors_txt(file_map.get("factors_txt"))
+    ic_csv_stat = file_stats.get("ic_csv")
+    ic_rows_csv, ic_warn = _parse_ic_csv(
+        file_map.get("ic_csv"),
+        ic_csv_stat.st_size if ic_csv_stat is not None else None,
+    )
+    info_summary, factors_info, ic_rows_info, info_warn = _parse_info_pkl(file_map.get("info_pkl"))
+    model_json_stat = file_stats.get("model_json")
+    model_meta, model_warn = _parse_model_json(
+        file_map.get("model_json"),
+        model_json_stat.st_size if model_json_stat is not None else None,
+    )
+
+    warnings = [*factor_warn, *ic_warn, *info_warn, *model_warn]
+
+    if not factors and factors_info:
+        factors = list(factors_info)
+    ic_rows = ic_rows_csv if ic_rows_csv else ic_rows_info
+
+    symbol = str(info_summary.get("symbol") or "").strip()
+    if not symbol and ic_rows:
+        symbol = str(ic_rows[0].get("symbol") or "").strip()
+    if not symbol:
+        symbol = _derive_symbol(group_key)
+
+    return_name = str(info_summary.get("return_name") or "").strip()
+    if not return_name and ic_rows:
+        return_name = str(ic_rows[0].get("return_name") or "").strip()
+    if not return_name:
+        return_name = _derive_return_name(group_key)
+
+    feature_dim = int(model_meta.get("feature_dim") or 0)
+    if feature_dim <= 0:
+        feature_dim = len(factors)
+
+    if feature_dim <= 0:
+        warnings.append(f"{group_key}: feature dimension unresolved")
+
+    if factors and feature_dim and len(factors) != feature_dim:
+        warnings.append(
+            f"{group_key}: factors count {len(factors)} differs from feature_dim {feature_dim}"
+        )
+
+    ic_by_factor: dict[str, float | None] = {
+        str(row.get("factor_name") or ""): _safe_float(row.get("Kendall_tau"))
+        for row in ic_rows
+        if str(row.get("factor_name") or "")
+    }
+
+    # pad/truncate once so the comprehension needs no per-dim bounds check
+    dim_names = factors[:feature_dim]
+    if len(dim_names) < feature_dim:
+        dim_names = dim_names + [""] * (feature_dim - len(dim_names))
+    dim_factors = [
+        DimFactor(dim, factor_name, ic_by_factor.get(factor_name))
+        for dim, factor_name in enumerate(dim_names)
+    ]
+
+    artifacts: dict[str, ArtifactFileMeta] = {}
+    for key, file_path in file_map.items():
+        file_meta = _file_meta(file_path, file_stats.get(key))
+        if file_meta is not None:
+            artifacts[key] = file_meta
+
+    has_model_onnx = file_map.get("model_onnx") is not None and file_map["model_onnx"].exists()
+    has_model_json = file_map.get("model_json") is not None and file_map["model_json"].exists()
+    has_model_pkl = file_map.get("model_pkl") is not None and file_map["model_pkl"].exists()
+    grpc_ready = (
+        (has_model_onnx or has_model_json or has_model_pkl)
+        and feature_dim > 0
+        and bool(symbol)
+    )
+
+    return SymbolRecord(
+        symbol=symbol,
+        group_key=group_key,
+        return_name=return_name,
+        feature_dim=feature_dim,
+        factor_count=len(factors),
+        grpc_ready=grpc_ready,
+        train_window_start_ts=_safe_int(info_summary.get("train_window_start_ts")),
+        train_window_end_ts=_safe_int(info_summary.get("train_window_end_ts")),
+        train_start_date=_as_iso(info_summary.get("train_start_date")),
+        train_end_date=_as_iso(info_summary.get("train_end_date")),
+        train_samples=_safe_int(info_summary.get("train_samples")),
+        train_time_sec=_safe_float(info_summary.get("train_time_sec")),
+        factors=factors,
+        dim_factors=dim_factors,
+        ic_rows=ic_rows,
+        info_summary=info_summary,
+        model_meta=model_meta,
+        artifacts=artifacts,
+        warnings=warnings,
+        symbol_norm=symbol.strip().upper(),
+    )
 
-        ic_by_factor: dict[str, float | None] = {
-            str(row.get("factor_name") or ""): _safe_float(row.get("Kendall_tau"))
-            for row in ic_rows
-            if str(row.get("factor_name") or "")
-        }
 
-        dim_factors: list[DimFactor] = []
-        for dim in range(feature_dim):
-            factor_name = factors[dim] if dim < len(factors) else ""
-            dim_factors.append(
-                DimFactor(
-                    dim=dim,
-                    factor_name=factor_name,
-                    kendall_tau=ic_by_factor.get(factor_name),
-                )
-            )
 
-        artifacts: dict[str, ArtifactFileMeta] = {}
-        for key, file_path in file_map.items():
-            file_meta = _file_meta(file_path)
-            if file_meta is not None:
-                artifacts[key] = file_meta
-
-        has_model_onnx = file_map.get("model_onnx") is not None and file_map["model_onnx"].exists()
-        has_model_json = file_map.get("model_json") is not None and file_map["model_json"].exists()
-        has_model_pkl = file_map.get("model_pkl") is not None and file_map["model_pkl"].exists()
-        grpc_ready = (
-            (has_model_onnx or has_model_json or has_model_pkl)
-            and feature_dim > 0
-            and bool(symbol)
+# resolved root -> group_key -> (artifact stat fingerprint, record) from the last scan
+_SCAN_CACHE: dict[str, dict[str, tuple[tuple[Any, ...], SymbolRecord]]] = {}
+
+
+
+def _group_fingerprint(
+    file_map: dict[str, Path],
+    file_stats: dict[str, os.stat_result],
+) -> tuple[Any, ...] | None:
+    if len(file_stats) != len(file_map):
+        return None  # some artifact could not be stat'ed; always reparse
+    return tuple(
+        sorted(
+            (kind, str(path), file_stats[kind].st_mtime_ns, file_stats[kind].st_size)
+            for kind, path in file_map.items()
         )
+    )
+
+
+
+def dump_scan_state(root_path: str) -> bytes | None:
+    # per-group (fingerprint, record) pairs from the last scan of root_path, for load_scan_state
+    root_key = str(Path(root_path).expanduser().resolve())
+    entries = _SCAN_CACHE.get(root_key)
+    if entries is None:
+        return None
+    payload = {
+        "version": SCAN_STATE_VERSION,
+        "root_path": root_key,
+        "groups": [
+            [group_key, fingerprint, record.to_dict()]
+            for group_key, (fingerprint, record) in entries.items()
+        ],
+    }
+    try:
+        # stdlib json on purpose: it round-trips NaN taus, which orjson would write as null
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+
+
+
+def scan_state_token(root_path: str) -> tuple[Any, ...] | None:
+    # cheap identity of the cached scan state: per-group fingerprints only, no records
+    entries = _SCAN_CACHE.get(str(Path(root_path).expanduser().resolve()))
+    if entries is None:
+        return None
+    return tuple((group_key, fingerprint) for group_key, (fingerprint, _record) in entries.items())
+
+
+
+def evict_scan_state(root_path: str) -> None:
+    # drop a root's cached records (and their IC rows) once no registered model points at it
+    _SCAN_CACHE.pop(str(Path(root_path).expanduser().resolve()), None)
+
+
 
-        record = SymbolRecord(
-            symbol=symbol,
-            group_key=group_key,
-            return_name=return_name,
-            feature_dim=feature_dim,
-            factor_count=len(factors),
-            grpc_ready=grpc_ready,
-            train_window_start_ts=_safe_int(info_summary.get("train_window_start_ts")),
-            train_window_end_ts=_safe_int(info_summary.get("train_window_end_ts")),
-            train_start_date=_as_iso(info_summary.get("train_start_date")),
-            train_end_date=_as_iso(info_summary.get("train_end_date")),
-            train_samples=_safe_int(info_summary.get("train_samples")),
-            train_time_sec=_safe_float(info_summary.get("train_time_sec")),
-            factors=factors,
-            dim_factors=dim_factors,
-            ic_rows=ic_rows,
-            info_summary=info_summary,
-            model_meta=model_meta,
-            artifacts=artifacts,
-            warnings=warnings,
+def load_scan_state(payload: bytes) -> tuple[Any, ...] | None:
+    # seed the scan cache so the next scan_model_root only reparses groups whose files changed;
+    # returns the payload's scan_state_token, or None if the blob is unusable
+    try:
+        data = json.loads(payload)
+        if data.get("version") != SCAN_STATE_VERSION:
+            return None
+        root_key = str(data["root_path"])
+        entries = {
+            str(group_key): (
+                tuple(tuple(part) for part in fingerprint),
+                SymbolRecord.from_dict(record),
+            )
+            for group_key, fingerprint, record in data["groups"]
+        }
+    except Exception:
+        return None
+    # a scan already done in this process is at least as fresh as anything persisted
+    _SCAN_CACHE.setdefault(root_key, entries)
+    return tuple((group_key, fingerprint) for group_key, (fingerprint, _record) in entries.items())
+
+
+
+def scan_model_root(
+    model_name: str,
+    root_path: str,
+    *,
+    executor: Executor | None = None,
+) -> ModelSnapshot:
+    # `executor` lets callers scanning several roots at once share one parse pool
+    root = Path(root_path).expanduser().resolve()
+    if not root.exists() or not root.is_dir():
+        raise ValueError(f"model root path not found or not directory: {root}")
+
+    grouped: dict[str, dict[str, Path]] = defaultdict(dict)
+    grouped_stats: dict[str, dict[str, os.stat_result]] = defaultdict(dict)
+    for entry in _iter_files(root):
+        matched = _classify_artifact(entry.name)
+        if matched is None:
+            continue
+        group_key, kind = matched
+        grouped[group_key][kind] = Path(entry.path)
+        try:
+            grouped_stats[group_key][kind] = entry.stat()
+        except OSError:
+            grouped_stats[group_key].pop(kind, None)
+
+    group_keys = sorted(grouped.keys())
+    root_key = str(root)
+    previous = _SCAN_CACHE.get(root_key, {})
+    fingerprints = {key: _group_fingerprint(grouped[key], grouped_stats[key]) for key in group_keys}
+
+    built: dict[str, SymbolRecord] = {}
+    stale: list[str] = []
+    for key in group_keys:
+        cached = previous.get(key)
+        if cached is not None and fingerprints[key] is not None and cached[0] == fingerprints[key]:
+            built[key] = cached[1]
+        else:
+            stale.append(key)
+
+    if len(stale) <= 1:
+        for key in stale:
+            built[key] = _build_symbol_record(key, grouped[key], grouped_stats[key])
+    elif executor is not None:
+        parsed = executor.map(
+            lambda key: _build_symbol_record(key, grouped[key], grouped_stats[key]),
+            stale,
         )
-        records.append(record)
+        built.update(zip(stale, parsed))
+    else:
+        # groups are independent and mostly file reads + decoding
+        workers = min(SCAN_MAX_WORKERS, len(stale))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as pool:
+            parsed = pool.map(
+                lambda key: _build_symbol_record(key, grouped[key], grouped_stats[key]),
+                stale,
+            )
+            built.update(zip(stale, parsed))
+
+    records = [built[key] for key in group_keys]
+    # replaced wholesale so groups that disappeared from disk drop out of the cache
+    _SCAN_CACHE[root_key] = {
+        key: (fingerprints[key], built[key])
+        for key in group_keys
+        if fingerprints[key] is not None
+    }
 
-        for warning in warnings:
-            scan_warnings.append(f"{group_key}: {warning}")
+    scan_warnings = [
+        f"{record.group_key}: {warning}"
+        for record in records
+        for warning in record.warnings
+    ]
 
     unique_symbols = sorted({record.symbol for record in records if record.symbol})
+    # dict.fromkeys dedupes while keeping first-seen order
+    unique_factors = tuple(
+        dict.fromkeys(
+            factor
+            for record in records
+            for factor in (str(raw).strip() for raw in record.factors)
+            if factor
+        )
+    )
 
     return ModelSnapshot(
         model_name=model_name,
@@ -443,6 +977,10 @@ def scan_model_root(model_name: str, root_path: str) -> ModelSnapshot:
         group_count=len(records),
         warnings=scan_warnings,
         symbols=records,
+        unique_factors=unique_factors,
+        symbol_columns=tuple(
+            tuple(getattr(record, name) for record in records) for name in SYMBOL_LIST_FIELDS
+        ),
     )
 
 
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import re
+import sqlite3
 import threading
-from dataclasses import asdict
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
 from .convert_pkl_to_xgb import ModelConversionError, convert_pkl_to_xgb_json
-from .convert_xgb_to_onnx import ModelOnnxConversionError, convert_xgb_json_to_onnx
+from .convert_xgb_to_onnx import ModelOnnxConversionError, convert_xgb_json_to_onnx, sha256_file_hex
 from .db import Database, RegisteredModel
-from .parser import ModelSnapshot, SymbolRecord, load_model_json_text, scan_model_root
+from .parser import (
+    SCAN_MAX_WORKERS,
+    ModelSnapshot,
+    SymbolRecord,
+    dump_scan_state,
+    evict_scan_state,
+    load_model_json_text,
+    load_scan_state,
+    scan_model_root,
+    scan_state_token,
+)
+
+
+# registered models walked concurrently at startup; group parsing shares one SCAN_MAX_WORKERS pool
+WARMUP_MAX_WORKERS = 32
 
 
 class ModelRegistryError(Exception):
@@ -25,17 +41,46 @@ class SymbolNotFound(ModelRegistryError):
     pass
 
 
+_UNSAFE_FILE_CHARS_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+@functools.lru_cache(maxsize=4096)
 def _safe_file_token(raw: str) -> str:
-    token = re.sub(r"[^A-Za-z0-9._-]+", "_", raw.strip())
+    # only model names and group keys come through here, so the cache stays small
+    token = _UNSAFE_FILE_CHARS_RE.sub("_", raw.strip())
     token = token.strip("._-")
     return token or "model"
 
 
+def _path_digest(path: Path) -> str:
+    # 12-hex-char discriminator for converted artifact file names, not a security boundary;
+    # the sha1 naming is kept so artifacts converted by earlier releases stay valid
+    return hashlib.sha1(str(path).encode("utf-8")).hexdigest()[:12]
+
+
+@functools.lru_cache(maxsize=4096)
+def _norm_symbol(raw: str) -> str:
+    # request-side symbols are a small closed set, so the strip/upper result is memoized
+    return raw.strip().upper()
+
+
 class ModelRegistry:
     def __init__(self, db: Database, converted_model_dir: Path | str | None = None) -> None:
         self.db = db
-        self._lock = threading.RLock()
+        # writers serialize on _lock; readers do a bare dict get (atomic) and never block
+        self._lock = threading.Lock()
         self._cache: dict[str, ModelSnapshot] = {}
+        # path -> (st_mtime_ns, st_size, sha256 hex); a rewritten file misses on its new stat
+        self._sha_cache: dict[str, tuple[int, int, str]] = {}
+        self._converted_paths: dict[tuple[str, str, str, str], Path] = {}
+        # converted target path -> lock; same-target conversions run once, different targets in parallel
+        self._build_locks: dict[str, threading.Lock] = {}
+        # artifact path as scanned -> expanduser().resolve() result; dropped whenever a model is rescanned
+        self._resolved_paths: dict[str, Path] = {}
+        # model_name -> scan_state_token of the blob last read from / written to SQLite
+        self._persisted_scan_state: dict[str, tuple[Any, ...]] = {}
+        # model_name -> (snapshot, normalized symbol -> records in default pick order)
+        self._symbol_index: dict[str, tuple[ModelSnapshot, dict[str, list[SymbolRecord]]]] = {}
         if converted_model_dir is None:
             self._converted_model_dir = (Path(__file__).resolve().parents[1] / "data" / "converted_models")
         else:
@@ -43,16 +88,40 @@ class ModelRegistry:
         self._converted_model_dir.mkdir(parents=True, exist_ok=True)
 
     def warmup(self) -> None:
-        for item in self.db.list_models():
-            self._refresh_model_from_row(item, raise_on_error=False)
+        rows = self.db.list_models()
+        if len(rows) <= 1:
+            for item in rows:
+                self._refresh_model_from_row(item, raise_on_error=False)
+            return
+
+        # model roots scan independently and are mostly filesystem latency; their group parses
+        # go to one shared pool so total parse concurrency stays at SCAN_MAX_WORKERS
+        workers = min(WARMUP_MAX_WORKERS, len(rows))
+        with (
+            ThreadPoolExecutor(max_workers=SCAN_MAX_WORKERS, thread_name_prefix="scan") as parse_pool,
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="warmup") as pool,
+        ):
+            futures = [
+                pool.submit(self._refresh_model_from_row, item, raise_on_error=False, executor=parse_pool)
+                for item in rows
+            ]
+            for future in as_completed(futures):
+                future.result()
 
     def list_registered_models(self) -> list[RegisteredModel]:
         return self.db.list_models()
 
-    def _refresh_model_from_row(self, row: RegisteredModel, raise_on_error: bool) -> None:
+    def _refresh_model_from_row(
+        self,
+        row: RegisteredModel,
+        raise_on_error: bool,
+        executor: Executor | None = None,
+    ) -> None:
         try:
-            snapshot = scan_model_root(row.model_name, row.root_path)
+            self._seed_scan_state(row.model_name)
+            snapshot = scan_model_root(row.model_name, row.root_path, executor=executor)
             self._assert_unique_symbols(snapshot)
+            self._persist_scan_state(row.model_name, snapshot.root_path)
         except Exception as exc:
             if raise_on_error:
                 raise ModelRegistryError(str(exc)) from exc
@@ -69,6 +138,7 @@ class ModelRegistry:
 
         with self._lock:
             self._cache[row.model_name] = snapshot
+            self._resolved_paths.clear()
 
     def add_or_refresh_model(self, model_name: str, root_path: str) -> ModelSnapshot:
         name = model_name.strip()
@@ -82,9 +152,11 @@ class ModelRegistry:
         snapshot = scan_model_root(name, path)
         self._assert_unique_symbols(snapshot)
         self.db.upsert_model(name, snapshot.root_path)
+        self._persist_scan_state(name, snapshot.root_path)
 
         with self._lock:
             self._cache[name] = snapshot
+            self._resolved_paths.clear()
         return snapshot
 
     def refresh_model(self, model_name: str) -> ModelSnapshot:
@@ -95,8 +167,10 @@ class ModelRegistry:
         snapshot = scan_model_root(row.model_name, row.root_path)
         self._assert_unique_symbols(snapshot)
         self.db.upsert_model(row.model_name, row.root_path)
+        self._persist_scan_state(row.model_name, snapshot.root_path)
         with self._lock:
             self._cache[row.model_name] = snapshot
+            self._resolved_paths.clear()
         return snapshot
 
     def delete_model(self, model_name: str) -> None:
@@ -104,36 +178,71 @@ class ModelRegistry:
         if not name:
             raise ModelRegistryError("model_name must not be empty")
 
+        row = self.db.get_model(name)
         deleted = self.db.delete_model(name)
         if not deleted:
             raise ModelNotFound(f"model not found: {name}")
 
         with self._lock:
             self._cache.pop(name, None)
+            self._resolved_paths.clear()
+            self._symbol_index.pop(name, None)
+            self._persisted_scan_state.pop(name, None)
+
+        # another registration may share the root; its scan cache entry is still live then
+        if row is not None and all(other.root_path != row.root_path for other in self.db.list_models()):
+            evict_scan_state(row.root_path)
+
+    def _seed_scan_state(self, model_name: str) -> None:
+        # cold start: seed the parser from the persisted state so only changed groups get reparsed
+        try:
+            stored = self.db.get_scan_state(model_name)
+        except sqlite3.Error:
+            return  # unreadable state just means a full scan
+        if stored is None:
+            return
+        token = load_scan_state(stored[1])
+        if token is not None:
+            self._persisted_scan_state[model_name] = token
+
+    def _persist_scan_state(self, model_name: str, root_path: str) -> None:
+        # compare fingerprints first; the blob is only serialized and written when a group changed
+        token = scan_state_token(root_path)
+        if token is None or self._persisted_scan_state.get(model_name) == token:
+            return
+        payload = dump_scan_state(root_path)
+        if payload is None:
+            return
+        try:
+            self.db.save_scan_state(model_name, root_path, payload)
+        except sqlite3.Error:
+            # persisted state only speeds up the next cold start; the live snapshot is already good
+            return
+        self._persisted_scan_state[model_name] = token
 
     def list_models(self) -> list[dict[str, Any]]:
         rows = self.db.list_models()
         output: list[dict[str, Any]] = []
-        with self._lock:
-            for row in rows:
-                snapshot = self._cache.get(row.model_name)
-                output.append(
-                    {
-                        "model_name": row.model_name,
-                        "root_path": row.root_path,
-                        "created_at": row.created_at,
-                        "updated_at": row.updated_at,
-                        "symbol_count": snapshot.symbol_count if snapshot else 0,
-                        "group_count": snapshot.group_count if snapshot else 0,
-                        "scanned_at": snapshot.scanned_at if snapshot else None,
-                        "warnings": list(snapshot.warnings) if snapshot else [],
-                    }
-                )
+        # one C-level copy gives a consistent view even if a refresh lands mid-loop
+        cache = dict(self._cache)
+        for row in rows:
+            snapshot = cache.get(row.model_name)
+            output.append(
+                {
+                    "model_name": row.model_name,
+                    "root_path": row.root_path,
+                    "created_at": row.created_at,
+                    "updated_at": row.updated_at,
+                    "symbol_count": snapshot.symbol_count if snapshot else 0,
+                    "group_count": snapshot.group_count if snapshot else 0,
+                    "scanned_at": snapshot.scanned_at if snapshot else None,
+                    "warnings": list(snapshot.warnings) if snapshot else [],
+                }
+            )
         return output
 
     def get_model_snapshot(self, model_name: str) -> ModelSnapshot:
-        with self._lock:
-            snapshot = self._cache.get(model_name)
+        snapshot = self._cache.get(model_name)
         if snapshot is not None:
             return snapshot
 
@@ -145,39 +254,40 @@ class ModelRegistry:
         self._assert_unique_symbols(snapshot)
         with self._lock:
             self._cache[row.model_name] = snapshot
+            self._resolved_paths.clear()
         return snapshot
 
     def list_symbols(self, model_name: str) -> list[dict[str, Any]]:
         snapshot = self.get_model_snapshot(model_name)
-        out: list[dict[str, Any]] = []
-        for record in snapshot.symbols:
-            out.append(
-                {
-                    "symbol": record.symbol,
-                    "group_key": record.group_key,
-                    "return_name": record.return_name,
-                    "feature_dim": record.feature_dim,
-                    "factor_count": record.factor_count,
-                    "grpc_ready": record.grpc_ready,
-                    "train_start_date": record.train_start_date,
-                    "train_end_date": record.train_end_date,
-                    "warnings": list(record.warnings),
-                }
-            )
-        return out
+        # zip over the precomputed columns (SYMBOL_LIST_FIELDS order) instead of per-record attribute reads
+        return [
+            {
+                "symbol": symbol,
+                "group_key": group_key,
+                "return_name": return_name,
+                "feature_dim": feature_dim,
+                "factor_count": factor_count,
+                "grpc_ready": grpc_ready,
+                "train_start_date": train_start_date,
+                "train_end_date": train_end_date,
+                "warnings": list(warnings),
+            }
+            for (
+                symbol,
+                group_key,
+                return_name,
+                feature_dim,
+                factor_count,
+                grpc_ready,
+                train_start_date,
+                train_end_date,
+                warnings,
+            ) in zip(*snapshot.symbol_columns)
+        ]
 
     def list_model_factors(self, model_name: str) -> dict[str, Any]:
         snapshot = self.get_model_snapshot(model_name)
-
-        factors: list[str] = []
-        seen: set[str] = set()
-        for record in snapshot.symbols:
-            for raw_factor in record.factors:
-                factor = str(raw_factor).strip()
-                if not factor or factor in seen:
-                    continue
-                seen.add(factor)
-                factors.append(factor)
+        factors = list(snapshot.unique_factors)
 
         return {
             "model_name": snapshot.model_name,
@@ -213,11 +323,11 @@ class ModelRegistry:
             "train_samples": chosen.train_samples,
             "train_time_sec": chosen.train_time_sec,
             "factors": list(chosen.factors),
-            "dim_factors": [asdict(item) for item in chosen.dim_factors],
+            "dim_factors": [item.to_dict() for item in chosen.dim_factors],
             "ic_rows": list(chosen.ic_rows),
             "info_summary": dict(chosen.info_summary),
             "model_meta": dict(chosen.model_meta),
-            "artifacts": {k: asdict(v) for k, v in chosen.artifacts.items()},
+            "artifacts": {k: v.to_dict() for k, v in chosen.artifacts.items()},
             "warnings": list(chosen.warnings),
         }
 
@@ -251,7 +361,7 @@ class ModelRegistry:
             "train_time_sec": record.train_time_sec,
             "model_json": model_json_text,
             "model_json_path": model_json_path,
-            "dim_factors": [asdict(item) for item in record.dim_factors],
+            "dim_factors": [item.to_dict() for item in record.dim_factors],
         }
 
     def build_model_onnx_payload(self, model_name: str, symbol: str) -> dict[str, Any]:
@@ -287,24 +397,42 @@ class ModelRegistry:
             "model_json_path": str(model_json_path),
             "model_onnx_path": str(model_onnx_path),
             "model_onnx_sha256": self._sha256_file(model_onnx_path),
-            "dim_factors": [asdict(item) for item in record.dim_factors],
+            "dim_factors": [item.to_dict() for item in record.dim_factors],
         }
 
+    def _symbols_by_norm(self, snapshot: ModelSnapshot) -> dict[str, list[SymbolRecord]]:
+        entry = self._symbol_index.get(snapshot.model_name)
+        if entry is not None and entry[0] is snapshot:
+            return entry[1]
+
+        index: dict[str, list[SymbolRecord]] = {}
+        for record in snapshot.symbols:
+            if record.symbol_norm:
+                index.setdefault(record.symbol_norm, []).append(record)
+        # 默认优先：payload可用 + train_end_date较新 + group_key字典序
+        for records in index.values():
+            records.sort(
+                key=lambda item: (
+                    int(item.grpc_ready),
+                    item.train_end_date or "",
+                    item.group_key,
+                ),
+                reverse=True,
+            )
+        self._symbol_index[snapshot.model_name] = (snapshot, index)
+        return index
+
     def _select_record(
         self,
         snapshot: ModelSnapshot,
         symbol: str,
         group_key: str | None,
     ) -> SymbolRecord:
-        normalized_symbol = symbol.strip().upper()
+        normalized_symbol = _norm_symbol(symbol)
         if not normalized_symbol:
             raise SymbolNotFound("symbol must not be empty")
 
-        candidates = [
-            record
-            for record in snapshot.symbols
-            if record.symbol.strip().upper() == normalized_symbol
-        ]
+        candidates = self._symbols_by_norm(snapshot).get(normalized_symbol)
         if not candidates:
             raise SymbolNotFound(
                 f"symbol '{normalized_symbol}' not found in model '{snapshot.model_name}'"
@@ -319,27 +447,15 @@ class ModelRegistry:
                 f"group_key '{group_key}' not found for symbol '{normalized_symbol}'"
             )
 
-        # 默认优先：payload可用 + train_end_date较新 + group_key字典序
-        candidates.sort(
-            key=lambda item: (
-                int(item.grpc_ready),
-                item.train_end_date or "",
-                item.group_key,
-            ),
-            reverse=True,
-        )
+        # index lists are already in default pick order
         return candidates[0]
 
     def _select_unique_record(self, snapshot: ModelSnapshot, symbol: str) -> SymbolRecord:
-        normalized_symbol = symbol.strip().upper()
+        normalized_symbol = _norm_symbol(symbol)
         if not normalized_symbol:
             raise SymbolNotFound("symbol must not be empty")
 
-        candidates = [
-            record
-            for record in snapshot.symbols
-            if record.symbol.strip().upper() == normalized_symbol
-        ]
+        candidates = self._symbols_by_norm(snapshot).get(normalized_symbol)
         if not candidates:
             raise SymbolNotFound(
                 f"symbol '{normalized_symbol}' not found in model '{snapshot.model_name}'"
@@ -353,18 +469,11 @@ class ModelRegistry:
         return candidates[0]
 
     def _assert_unique_symbols(self, snapshot: ModelSnapshot) -> None:
-        symbol_groups: dict[str, set[str]] = {}
-        for record in snapshot.symbols:
-            normalized_symbol = record.symbol.strip().upper()
-            if not normalized_symbol:
-                continue
-            groups = symbol_groups.setdefault(normalized_symbol, set())
-            groups.add(record.group_key)
-
+        # group keys are unique within a snapshot, so >1 record means >1 group
         duplicates = [
-            (symbol, sorted(groups))
-            for symbol, groups in symbol_groups.items()
-            if len(groups) > 1
+            (symbol, sorted(record.group_key for record in records))
+            for symbol, records in self._symbols_by_norm(snapshot).items()
+            if len(records) > 1
         ]
         if not duplicates:
             return
@@ -385,7 +494,7 @@ class ModelRegistry:
     def _resolve_model_json_path(self, snapshot: ModelSnapshot, record: SymbolRecord) -> str:
         model_json_meta = record.artifacts.get("model_json")
         if model_json_meta is not None:
-            model_json_path = Path(model_json_meta.path).expanduser().resolve()
+            model_json_path = self._resolve_artifact_path(model_json_meta.path)
             if model_json_path.exists():
                 return str(model_json_path)
 
@@ -393,13 +502,15 @@ class ModelRegistry:
         if model_pkl_meta is None:
             raise SymbolNotFound(f"model json/model pkl path missing for {record.group_key}")
 
-        model_pkl_path = Path(model_pkl_meta.path).expanduser().resolve()
+        model_pkl_path = self._resolve_artifact_path(model_pkl_meta.path)
         if not model_pkl_path.exists():
             raise SymbolNotFound(f"model pkl path missing for {record.group_key}")
 
         target_path = self._build_converted_json_path(snapshot.model_name, record.group_key, model_pkl_path)
         try:
-            converted = convert_pkl_to_xgb_json(model_pkl_path, target_path)
+            # the converter re-checks target freshness, so a waiter just picks up the finished file
+            with self._build_lock(target_path):
+                converted = convert_pkl_to_xgb_json(model_pkl_path, target_path)
         except ModelConversionError as exc:
             raise SymbolNotFound(f"failed to convert model.pkl for {record.group_key}: {exc}") from exc
 
@@ -413,17 +524,22 @@ class ModelRegistry:
     ) -> str:
         model_onnx_meta = record.artifacts.get("model_onnx")
         if model_onnx_meta is not None:
-            model_onnx_path = Path(model_onnx_meta.path).expanduser().resolve()
-            if model_onnx_path.exists() and model_onnx_path.stat().st_size > 0:
-                return str(model_onnx_path)
+            model_onnx_path = self._resolve_artifact_path(model_onnx_meta.path)
+            try:
+                if model_onnx_path.stat().st_size > 0:
+                    return str(model_onnx_path)
+            except OSError:
+                pass
 
         target_path = self._build_converted_onnx_path(snapshot.model_name, record.group_key, model_json_path)
         try:
-            converted = convert_xgb_json_to_onnx(
-                model_json_path,
-                target_path,
-                feature_dim=record.feature_dim,
-            )
+            with self._build_lock(target_path):
+                converted = convert_xgb_json_to_onnx(
+                    model_json_path,
+                    target_path,
+                    feature_dim=record.feature_dim,
+                    cache_dir=self._converted_model_dir / ".cache",
+                )
         except ModelOnnxConversionError as exc:
             raise ModelRegistryError(
                 f"failed to convert ONNX artifact for {record.group_key}: {exc}"
@@ -431,22 +547,46 @@ class ModelRegistry:
 
         return str(converted)
 
-    def _build_converted_json_path(self, model_name: str, group_key: str, model_pkl_path: Path) -> Path:
+    def _resolve_artifact_path(self, raw: str) -> Path:
+        # existence is still checked by the caller; only the per-component resolve walk is cached
+        resolved = self._resolved_paths.get(raw)
+        if resolved is None:
+            resolved = Path(raw).expanduser().resolve()
+            self._resolved_paths[raw] = resolved
+        return resolved
+
+    def _build_lock(self, target: Path) -> threading.Lock:
+        key = str(target)
+        lock = self._build_locks.get(key)
+        if lock is None:
+            with self._lock:
+                lock = self._build_locks.setdefault(key, threading.Lock())
+        return lock
+
+    def _build_converted_path(self, model_name: str, group_key: str, source: Path, suffix: str) -> Path:
+        key = (model_name, group_key, str(source), suffix)
+        target = self._converted_paths.get(key)
+        if target is not None:
+            return target
+
         model_dir = self._converted_model_dir / _safe_file_token(model_name)
-        digest = hashlib.sha1(str(model_pkl_path).encode("utf-8")).hexdigest()[:12]
-        file_name = f"{_safe_file_token(group_key)}.{digest}.model.json"
-        return model_dir / file_name
+        target = model_dir / f"{_safe_file_token(group_key)}.{_path_digest(source)}{suffix}"
+        self._converted_paths[key] = target
+        return target
+
+    def _build_converted_json_path(self, model_name: str, group_key: str, model_pkl_path: Path) -> Path:
+        return self._build_converted_path(model_name, group_key, model_pkl_path, ".model.json")
 
     def _build_converted_onnx_path(self, model_name: str, group_key: str, model_json_path: Path) -> Path:
-        model_dir = self._converted_model_dir / _safe_file_token(model_name)
-        digest = hashlib.sha1(str(model_json_path).encode("utf-8")).hexdigest()[:12]
-        file_name = f"{_safe_file_token(group_key)}.{digest}.model.onnx"
-        return model_dir / file_name
-
-    @staticmethod
-    def _sha256_file(path: Path) -> str:
-        digest = hashlib.sha256()
-        with path.open("rb") as fh:
-            for chunk in iter(lambda: fh.read(1024 * 1024), b""):
-                digest.update(chunk)
-        return digest.hexdigest()
+        return self._build_converted_path(model_name, group_key, model_json_path, ".model.onnx")
+
+    def _sha256_file(self, path: Path) -> str:
+        key = str(path)
+        st = path.stat()
+        cached = self._sha_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        hexdigest = sha256_file_hex(path)
+        self._sha_cache[key] = (st.st_mtime_ns, st.st_size, hexdigest)
+        return hexdigest
@@ -99,7 +99,8 @@ class ModelWatcher:
         while not self._stop.is_set():
             start = time.time()
             try:
-                self._tick()
+                # fingerprinting + refresh walk the filesystem and write SQLite; keep it off the loop
+                await asyncio.to_thread(self._tick)
             except Exception as exc:
                 LOG.warning("watch tick failed: %s", exc)
 
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import json
+from typing import Any
+
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import FileResponse, Response
@@ -9,6 +12,22 @@ from pydantic import BaseModel, Field
 from .config import Settings
 from .registry import ModelNotFound, ModelRegistry, ModelRegistryError, SymbolNotFound
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional: stdlib json with the same compact output as JSONResponse
+    orjson = None
+
+
+def _json_bytes(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_response(content: Any) -> Response:
+    # pre-encoded body skips FastAPI's jsonable_encoder walk over every row
+    return Response(content=_json_bytes(content), media_type="application/json")
+
 
 class AddModelRequest(BaseModel):
     model_name: str = Field(min_length=1, max_length=128)
@@ -43,8 +62,10 @@ def create_app(settings: Settings, registry: ModelRegistry) -> FastAPI:
     async def health() -> dict[str, str]:
         return {"status": "ok"}
 
+    # registry calls scan the filesystem, hit SQLite and run conversions; plain `def`
+    # endpoints run on FastAPI's worker threadpool instead of blocking the event loop
     @app.post("/api/models")
-    async def add_model(
+    def add_model(
         payload: AddModelRequest,
     ) -> dict[str, object]:
         try:
@@ -65,7 +86,7 @@ def create_app(settings: Settings, registry: ModelRegistry) -> FastAPI:
         }
 
     @app.delete("/api/models/{model_name}")
-    async def delete_model(model_name: str) -> dict[str, object]:
+    def delete_model(model_name: str) -> dict[str, object]:
         name = model_name.strip()
         try:
             registry.delete_model(name)
@@ -83,7 +104,7 @@ def create_app(settings: Settings, registry: ModelRegistry) -> FastAPI:
         }
 
     @app.post("/api/models/{model_name}/refresh")
-    async def refresh_model(model_name: str) -> dict[str, object]:
+    def refresh_model(model_name: str) -> dict[str, object]:
         try:
             snapshot = registry.refresh_model(model_name)
         except ModelNotFound as exc:
@@ -103,11 +124,11 @@ def create_app(settings: Settings, registry: ModelRegistry) -> FastAPI:
         }
 
     @app.get("/api/models")
-    async def list_models() -> dict[str, object]:
-        return {"items": registry.list_models()}
+    def list_models() -> Response:
+        return _json_response({"items": registry.list_models()})
 
     @app.get("/api/models/{model_name}/symbols")
-    async def list_symbols(
+    def list_symbols(
         model_name: str,
     ) -> dict[str, object]:
         try:
@@ -117,7 +138,7 @@ def create_app(settings: Settings, registry: ModelRegistry) -> FastAPI:
         return {"items": symbols}
 
     @app.get("/api/models/{model_name}/factors")
-    async def list_model_factors(
+    def list_model_factors(
         model_name: str,
     ) -> dict[str, object]:
         try:
@@ -127,7 +148,7 @@ def create_app(settings: Settings, registry: ModelRegistry) -> FastAPI:
         return factors
 
     @app.get("/api/models/{model_name}/symbols/{symbol}")
-    async def get_symbol_detail(
+    def get_symbol_detail(
         model_name: str,
         symbol: str,
         request: Request,
@@ -142,7 +163,7 @@ def create_app(settings: Settings, registry: ModelRegistry) -> FastAPI:
         return detail
 
     @app.get("/api/models/{model_name}/model/{symbol}")
-    async def get_model_payload(
+    def get_model_payload(
         model_name: str,
         symbol: str,
     ) -> dict[str, object]:
@@ -177,7 +198,7 @@ def create_app(settings: Settings, registry: ModelRegistry) -> FastAPI:
         }
 
     @app.get("/api/models/{model_name}/model_onnx/{symbol}")
-    async def get_model_onnx_binary(model_name: str, symbol: str) -> FileResponse:
+    def get_model_onnx_binary(model_name: str, symbol: str) -> FileResponse:
         try:
             payload = registry.build_model_onnx_payload(model_name=model_name, symbol=symbol)
         except ModelNotFound as exc:
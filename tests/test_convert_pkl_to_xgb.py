@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+xgb = pytest.importorskip("xgboost")
+
+from backend import convert_pkl_to_xgb as conv
+
+
+def _train_booster() -> "xgb.Booster":
+    rng = np.random.default_rng(0)
+    features = rng.random((200, 5))
+    labels = rng.random(200)
+    return xgb.train({"max_depth": 3}, xgb.DMatrix(features, label=labels), num_boost_round=5)
+
+
+def _train_regressor() -> "xgb.XGBRegressor":
+    rng = np.random.default_rng(1)
+    features = rng.random((200, 5))
+    labels = rng.random(200)
+    return xgb.XGBRegressor(n_estimators=5, max_depth=3).fit(features, labels)
+
+
+@pytest.fixture(params=["booster", "regressor"])
+def model_pkl(request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+    model = _train_booster() if request.param == "booster" else _train_regressor()
+    path = tmp_path / f"G1_{request.param}_model.pkl"
+    path.write_bytes(pickle.dumps(model))
+    return path
+
+
+def test_fast_path_restores_booster(model_pkl: Path) -> None:
+    blob = conv._try_fast_extract(model_pkl)
+    assert blob is not None
+
+    booster = conv._booster_from_raw(blob)
+    assert booster is not None
+
+    expected = conv._resolve_savable_model(pickle.loads(model_pkl.read_bytes()))
+    assert bytes(booster.save_raw(raw_format="json")) == bytes(expected.save_raw(raw_format="json"))
+
+
+def test_convert_uses_fast_path(model_pkl: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def _no_unpickle(path: Path) -> None:
+        raise AssertionError(f"fast path fell back to pickle.load for {path}")
+
+    monkeypatch.setattr(conv, "_load_pickle", _no_unpickle)
+    target = conv.convert_pkl_to_xgb_json(model_pkl, tmp_path / "out.json")
+
+    expected = conv._resolve_savable_model(pickle.loads(model_pkl.read_bytes()))
+    assert target.read_bytes() == bytes(expected.save_raw(raw_format="json"))